@@ -0,0 +1,55 @@
+"""
+Connection settings shared by the StabilityApp scripts.
+
+Both database/load_data.py and scripts/report_generator.py build their
+pyodbc connection strings with build_connection_string(), so pooling and
+authentication are configured in one place.
+"""
+
+import os
+import pyodbc
+
+# Let the ODBC driver manager pool connections so repeated connects within
+# one process (e.g. a pipeline calling the loader and the report generator)
+# reuse an open session instead of repeating the login handshake. Must be
+# set before the first connection is made, which importing this module
+# guarantees.
+pyodbc.pooling = True
+
+
+def _quote(value):
+    """Brace-quote an ODBC attribute value, doubling any '}' inside it."""
+
+    return "{" + value.replace("}", "}}") + "}"
+
+
+def _auth_attributes():
+    """Return the authentication part of the connection string.
+
+    SQL authentication is used when STABILITY_DB_UID (and optionally
+    STABILITY_DB_PWD) is set in the environment, which avoids a Kerberos/SSPI
+    negotiation on every connect for scripted runs; otherwise Windows
+    authentication is used. Both values are brace-quoted so characters such
+    as ';' don't break the connection string.
+    """
+
+    uid = os.environ.get("STABILITY_DB_UID")
+    if not uid:
+        return "Trusted_Connection=yes;"
+    pwd = os.environ.get("STABILITY_DB_PWD", "")
+    return f"UID={_quote(uid)};PWD={_quote(pwd)};"
+
+
+def build_connection_string(server):
+    """Return the pyodbc connection string for StabilityApp on `server`.
+
+    TrustServerCertificate is enabled for local development convenience.
+    """
+
+    return (
+        "DRIVER={ODBC Driver 18 for SQL Server};"
+        f"SERVER={server};"
+        "DATABASE=StabilityApp;"
+        f"{_auth_attributes()}"
+        "TrustServerCertificate=yes;"
+    )
@@ -8,157 +8,558 @@ and creates a report request for records that include an email.
 
 The script is intentionally simple and synchronous. It assumes the
 database already has the lookup rows populated (AgeRanges, Regions,
-Indicators). Duplicated submission IDs are skipped.
+Indicators). Duplicated submission IDs are skipped. The CSV is streamed and
+committed in chunks so memory stays bounded for large exports.
+
+By default each chunk is staged in a temp table and the target tables are
+populated with set-based INSERT ... SELECT statements, so lookup labels are
+resolved by joins on the server. Run with --client-lookups to map the
+labels in Python instead and send rows with batched executemany() calls.
 """
 
+import functools
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import pyodbc
+import sys
 import uuid
-from datetime import datetime
+
+from db_connection import build_connection_string
 
 print("=== Stability App Data Loader ===")
 
-# Database connection string used by pyodbc. Adjust SERVER/DATABASE as needed.
-connection_string = (
-    "DRIVER={ODBC Driver 18 for SQL Server};"
-    "SERVER=localhost\\SQLEXPRESS;"
-    "DATABASE=StabilityApp;"
-    "Trusted_Connection=yes;"
-    "TrustServerCertificate=yes;"
+# Database connection string used by pyodbc. Adjust SERVER as needed; pooling
+# and authentication are configured in db_connection.
+connection_string = build_connection_string("localhost\\SQLEXPRESS")
+
+
+# Survey export read by both load paths, and the number of bytes of it
+# parsed, loaded and committed at a time. The CSV reader splits the file
+# into blocks of this size, so it sets the size of each chunk.
+CSV_PATH = 'data/survey_responses_rows.csv'
+CSV_BLOCK_SIZE = 1 << 20
+
+# Maximum number of parameter rows sent per executemany() call.
+BATCH_SIZE = 1000
+
+# Frame columns (as produced by _prepare_submissions) in the parameter order
+# of INSERT_SUBMISSION_SQL.
+SUBMISSION_COLUMNS = [
+    'id', 'created_at', 'age_range_id', 'region_id',
+    'instability_ratio', 'first_name', 'last_name', 'email',
+]
+
+# Matches the canonical 8-4-4-4-12 hex UUID form used by the survey export.
+UUID_PATTERN = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
+
+INSERT_SUBMISSION_SQL = """
+    INSERT INTO Submissions (submission_id, created_at, age_range_id, region_id,
+                             instability_ratio, first_name, last_name, email)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_SCORE_SQL = """
+    INSERT INTO SubmissionScores (submission_id, indicator_id, score_value)
+    VALUES (?, ?, ?)
+"""
+
+# Run once after all submissions are written: every submission with an
+# email that has no report request yet gets one with status 'completed' so
+# downstream processes know a report has been generated.
+INSERT_REPORT_REQUESTS_SQL = """
+    INSERT INTO ReportRequests (submission_id, status)
+    SELECT s.submission_id, 'completed'
+    FROM Submissions s
+    WHERE s.email IS NOT NULL AND LTRIM(RTRIM(s.email)) <> ''
+      AND NOT EXISTS (SELECT 1 FROM ReportRequests rr WHERE rr.submission_id = s.submission_id)
+"""
+
+# CSV -> indicator name mapping. The CSV uses rate columns named for specific
+# indicators; map those column names to the indicator label stored in the
+# Indicators lookup table.
+INDICATOR_MAPPING = {
+    'economic_management_rate': 'Economic Management',
+    'immigration_policy_rate': 'Immigration Policy',
+    'foreign_policy_rate': 'Foreign Policy',
+    'domestic_policy_rate': 'Domestic Policy',
+    'social_policy_rate': 'Social Policy'
+}
+
+# Columns read from the CSV and their Arrow parse types. IDs and timestamps
+# stay strings since they are validated and parsed by _clean_submissions().
+# Rates are 0-100 and fit nullable Int8, so they no longer come back as
+# float64 just because some rows are empty. instability_ratio stays float64:
+# float32 cannot hold two-decimal values such as 20.8 exactly, and the
+# column is DECIMAL(5,2).
+CSV_COLUMNS = [
+    'id', 'created_at', 'age_range', 'region', *INDICATOR_MAPPING,
+    'instability_ratio', 'first_name', 'last_name', 'email',
+]
+CSV_COLUMN_TYPES = {
+    'id': pa.string(),
+    'created_at': pa.string(),
+    'age_range': pa.string(),
+    'region': pa.string(),
+    **{col: pa.int8() for col in INDICATOR_MAPPING},
+    'instability_ratio': pa.float64(),
+    'first_name': pa.string(),
+    'last_name': pa.string(),
+    'email': pa.string(),
+}
+
+# Arrow -> pandas dtypes used when converting each batch, so rates stay
+# nullable Int8 and text becomes the pandas string dtype.
+ARROW_TO_PANDAS_TYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.string(): pd.StringDtype(),
+}
+
+# Columns of the #StgSubmissions staging table, in the order the parameter
+# tuples are built. They mirror the CSV, with lookups kept as raw labels so
+# they can be resolved by joins on the server.
+STAGING_COLUMNS = CSV_COLUMNS
+
+CREATE_STAGING_SQL = """
+    IF OBJECT_ID('tempdb..#StgSubmissions') IS NOT NULL DROP TABLE #StgSubmissions;
+    CREATE TABLE #StgSubmissions (
+        id UNIQUEIDENTIFIER NOT NULL PRIMARY KEY,
+        created_at DATETIME2 NOT NULL,
+        age_range NVARCHAR(20),
+        region NVARCHAR(50),
+        economic_management_rate INT,
+        immigration_policy_rate INT,
+        foreign_policy_rate INT,
+        domestic_policy_rate INT,
+        social_policy_rate INT,
+        instability_ratio DECIMAL(5,2),
+        first_name NVARCHAR(100),
+        last_name NVARCHAR(100),
+        email NVARCHAR(255)
+    );
+"""
+
+TRUNCATE_STAGING_SQL = "TRUNCATE TABLE #StgSubmissions"
+
+INSERT_STAGING_SQL = (
+    f"INSERT INTO #StgSubmissions ({', '.join(STAGING_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in STAGING_COLUMNS)})"
 )
 
+# Staged rows whose ID already exists are removed first, so the statements
+# below only ever see new submissions.
+DELETE_STAGED_DUPLICATES_SQL = """
+    DELETE s FROM #StgSubmissions s
+    WHERE EXISTS (SELECT 1 FROM Submissions x WHERE x.submission_id = s.id)
+"""
 
-def load_survey_data():
-    """Read CSV rows and insert them into the database.
+INSERT_SUBMISSIONS_FROM_STAGING_SQL = """
+    INSERT INTO Submissions (submission_id, created_at, age_range_id, region_id,
+                             instability_ratio, first_name, last_name, email)
+    SELECT s.id, s.created_at, ar.age_range_id, r.region_id,
+           s.instability_ratio, s.first_name, s.last_name, s.email
+    FROM #StgSubmissions s
+    LEFT JOIN AgeRanges ar ON ar.age_range_label = s.age_range
+    LEFT JOIN Regions r ON r.region_name = s.region
+"""
+
+# The five rate columns are unpivoted with CROSS APPLY (VALUES ...) and joined
+# to Indicators by name to resolve indicator_id.
+INSERT_SCORES_FROM_STAGING_SQL = f"""
+    INSERT INTO SubmissionScores (submission_id, indicator_id, score_value)
+    SELECT s.id, i.indicator_id, v.score_value
+    FROM #StgSubmissions s
+    CROSS APPLY (VALUES {', '.join(f"(N'{name}', s.{col})" for col, name in INDICATOR_MAPPING.items())})
+        AS v (indicator_name, score_value)
+    JOIN Indicators i ON i.indicator_name = v.indicator_name
+    WHERE v.score_value IS NOT NULL
+"""
 
-    Behavior and contract:
-    - Input: CSV file at data/survey_responses_rows.csv; each row must have a
-      UUID in the `id` column and an ISO timestamp in `created_at`.
-    - Output: Inserts into Submissions, SubmissionScores and ReportRequests.
-    - Errors: Invalid UUIDs are skipped; duplicate submission IDs are skipped
-      (handled by catching IntegrityError). Any other exception triggers a
-      rollback of the transaction.
-    """
 
-    print("1. Reading CSV file...")
+def _open_cursor(conn):
+    """Prepare `conn` for a load and return a cursor ready for bulk work.
 
-    # Read CSV into a pandas DataFrame. We intentionally don't specify dtypes
-    # here to allow for slight variations in input. Downstream code checks for
-    # NaNs using pandas utilities before casting/using values.
-    df = pd.read_csv('data/survey_responses_rows.csv')
-    print(f"   Found {len(df)} records in CSV")
+    autocommit is disabled explicitly so every statement joins one
+    transaction that is committed (or rolled back) by the caller.
+    SET NOCOUNT ON stops the server from sending a row-count message for
+    every INSERT, which matters when thousands of small inserts are sent.
+    """
 
-    print("2. Connecting to database...")
-    conn = pyodbc.connect(connection_string)
+    conn.autocommit = False
     cursor = conn.cursor()
+    cursor.execute("SET NOCOUNT ON")
+    return cursor
+
+
+def _execute_counted(cursor, sql):
+    """Run a set-based statement and return the number of rows it affected.
+
+    With NOCOUNT on, cursor.rowcount is not reported, so @@ROWCOUNT is
+    selected in the same batch instead.
+    """
+
+    return cursor.execute(sql + "\n    SELECT @@ROWCOUNT").fetchval()
+
+
+def _fetch_existing_submission_ids(cursor):
+    """Return every submission_id already stored in Submissions.
+
+    The IDs are read once per load and returned as a set of uuid.UUID values
+    so duplicates can be skipped with a cheap membership test. For very
+    large tables the staging-table path (bulk_load_survey_data) checks
+    duplicates server-side instead.
+    """
+
+    cursor.execute("SELECT submission_id FROM Submissions")
+    # pyodbc may return UNIQUEIDENTIFIER values as strings; normalise them so
+    # they compare equal to the uuid.UUID values parsed from the CSV.
+    return {uuid.UUID(str(row[0])) for row in cursor.fetchall()}
+
+
+def _clean_submissions(df):
+    """Validate and convert the raw CSV frame with vectorized pandas ops.
+
+    Rows with a malformed `id` or unparseable `created_at` are dropped, as
+    are repeated IDs (the first valid occurrence wins). IDs become uuid.UUID
+    values and timestamps become naive UTC datetimes.
+    """
+
+    # Keep only well-formed UUIDs; missing IDs count as malformed.
+    df = df[df['id'].str.match(UUID_PATTERN, case=False, na=False)].copy()
+    df['id'] = df['id'].map(uuid.UUID)
+
+    # Parse timestamps in one vectorized pass; the CSV stores UTC offsets
+    # which we drop to produce naive datetimes for the DATETIME2 column.
+    # Microsecond resolution matches what Python datetimes (and so pyodbc)
+    # can represent.
+    df['created_at'] = (
+        pd.to_datetime(df['created_at'], utc=True, format='ISO8601', errors='coerce')
+        .dt.tz_localize(None)
+        .astype('datetime64[us]')
+    )
+    # Duplicates are dropped only after invalid rows are gone, so a bad first
+    # copy of an ID doesn't hide a later valid one.
+    return df[df['created_at'].notna()].drop_duplicates(subset='id')
+
+
+def _to_db_values(df):
+    """Return `df` as object columns with NaNs replaced by None.
+
+    This lets each row's values be used (and sent to pyodbc) directly,
+    without per-cell pd.notna() checks. `created_at` is converted to plain
+    datetime objects here, only once the rows are about to be emitted.
+    """
+
+    values = df.astype(object).where(df.notna(), None)
+    if 'created_at' in df:
+        values['created_at'] = pd.Series(
+            df['created_at'].dt.to_pydatetime(), index=df.index, dtype=object
+        )
+    return values
+
+
+def _prepare_submissions(df, age_ranges, regions):
+    """Clean the raw CSV frame and resolve its lookup labels in Python.
+
+    On top of _clean_submissions(), the age range and region labels are
+    replaced by their lookup IDs and remaining NaNs become None so the
+    values can be handed to pyodbc as-is.
+    """
+
+    df = _clean_submissions(df)
+
+    # Map CSV string labels to integer lookup IDs; unknown or missing labels
+    # become NA. Int64 keeps the IDs integral despite the missing values.
+    df['age_range_id'] = df['age_range'].map(age_ranges).astype('Int64')
+    df['region_id'] = df['region'].map(regions).astype('Int64')
+    df = df.drop(columns=['age_range', 'region'])
+
+    return _to_db_values(df)
+
+
+def _melt_scores(df, indicator_ids):
+    """Unpivot the rate columns of `df` into SubmissionScores parameter rows.
+
+    `indicator_ids` maps each CSV rate column to its indicator_id. Returns a
+    list of (submission_id, indicator_id, score_value) tuples for every
+    non-empty score. The rate columns are read as nullable Int8, so the
+    scores are already integers and need no cast.
+    """
+
+    scores_long = df.melt(
+        id_vars=['id'], value_vars=list(INDICATOR_MAPPING),
+        var_name='col', value_name='score',
+    ).dropna(subset=['score'])
+    scores_long['indicator_id'] = scores_long['col'].map(indicator_ids)
+    return _param_rows(scores_long, ['id', 'indicator_id', 'score'])
 
-    try:
-        print("3. Loading lookup tables...")
 
-        # Load lookup tables into Python dictionaries for fast mapping from the
-        # CSV's string labels to the integer surrogate keys used by the DB.
-        cursor.execute("SELECT age_range_id, age_range_label FROM AgeRanges")
-        age_ranges = {row.age_range_label: row.age_range_id for row in cursor.fetchall()}
-        print(f"   Age ranges: {age_ranges}")
+def _param_rows(df, columns):
+    """Return `columns` of `df` as a list of pyodbc parameter tuples.
 
-        cursor.execute("SELECT region_id, region_name FROM Regions")
-        regions = {row.region_name: row.region_id for row in cursor.fetchall()}
-        print(f"   Regions: {regions}")
+    Each column is converted to a Python list in a single call and the lists
+    are zipped into row tuples, so no Python-level loop or per-row
+    namedtuple is involved.
+    """
+
+    return list(zip(*(df[col].tolist() for col in columns)))
+
+
+def _executemany_batched(cursor, sql, rows):
+    """Send `rows` with executemany() in slices of at most BATCH_SIZE.
+
+    Nothing is sent for an empty list because pyodbc rejects executemany()
+    with no parameters.
+    """
+
+    for start in range(0, len(rows), BATCH_SIZE):
+        cursor.executemany(sql, rows[start:start + BATCH_SIZE])
+
+
+def _read_survey_chunks():
+    """Yield the survey CSV as DataFrames of roughly CSV_BLOCK_SIZE bytes.
+
+    The file is streamed with pyarrow's CSV reader into typed Arrow record
+    batches (only CSV_COLUMNS, with CSV_COLUMN_TYPES, so no type inference
+    is needed). Each batch is converted to pandas as it arrives, so only one
+    block of the file is held in memory and each chunk can be committed on
+    its own.
+
+    Streaming reads are always single-threaded in pyarrow. The
+    multi-threaded pa_csv.read_csv() would parse the whole file into one
+    table first, which gives up the bounded memory of the chunked load, so
+    streaming is used instead.
+    """
+
+    reader = pa_csv.open_csv(
+        CSV_PATH,
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=CSV_COLUMN_TYPES,
+            include_columns=CSV_COLUMNS,
+            # Treat empty text cells as missing, as pandas does.
+            strings_can_be_null=True,
+        ),
+    )
+    for batch in reader:
+        yield batch.to_pandas(types_mapper=ARROW_TO_PANDAS_TYPES.get)
+
+
+def _load_chunk(cursor, df, age_ranges, regions, indicator_ids, existing_ids):
+    """Insert one CSV chunk with batched executemany() calls.
+
+    `existing_ids` is the set of submission IDs already in the database; it
+    is updated in place with the IDs inserted from this chunk. Returns a
+    (submissions_loaded, scores_loaded) tuple. The caller owns the
+    transaction and commits after each chunk.
+    """
 
-        cursor.execute("SELECT indicator_id, indicator_name FROM Indicators")
-        indicators = {row.indicator_name: row.indicator_id for row in cursor.fetchall()}
-        print(f"   Indicators: {indicators}")
+    # Validate, parse and map the whole chunk up front so the parameter rows
+    # can be built straight from already-typed columns.
+    df = _prepare_submissions(df, age_ranges, regions)
+
+    # Drop submissions already present in the database (including ones
+    # inserted from earlier chunks) so duplicates are skipped up front
+    # rather than failing a batch.
+    df = df[~df['id'].isin(existing_ids)]
+
+    # Unpivot the score columns for every new submission in one vector op.
+    scores_rows = _melt_scores(df, indicator_ids)
+
+    # Submissions go out first so every score's foreign key is satisfied.
+    _executemany_batched(cursor, INSERT_SUBMISSION_SQL, _param_rows(df, SUBMISSION_COLUMNS))
+    _executemany_batched(cursor, INSERT_SCORE_SQL, scores_rows)
+    existing_ids.update(df['id'])
+    return len(df), len(scores_rows)
+
+
+def _run_load(conn, prepare):
+    """Run a chunked load and the steps shared by both load paths.
+
+    Opens a connection unless `conn` is supplied, then calls
+    `prepare(cursor)` for the path-specific setup; it returns a callable
+    that loads one CSV chunk and returns (submissions_loaded, scores_loaded).
+    Each chunk is committed on its own, report requests are created once at
+    the end and a summary is printed. Any exception rolls back the current
+    step and stops the load. A caller's `conn` gets its autocommit and
+    NOCOUNT settings back once the load is over.
+    """
+
+    print("1. Connecting to database...")
+    owns_conn = conn is None
+    if owns_conn:
+        conn = pyodbc.connect(connection_string, autocommit=False)
+    else:
+        # _open_cursor() changes both settings for the whole session, so
+        # remember the caller's values (NOCOUNT is bit 512 of @@OPTIONS).
+        caller_autocommit = conn.autocommit
+        caller_nocount = bool(conn.execute("SELECT @@OPTIONS & 512").fetchval())
+    cursor = _open_cursor(conn)
+
+    try:
+        load_chunk = prepare(cursor)
 
         submissions_loaded = 0
         scores_loaded = 0
 
-        print("4. Processing submissions...")
-
-        # Iterate over CSV rows and insert into the DB. We use iterrows() which is
-        # fine for relatively small datasets; for large volumes consider chunking
-        # or using a bulk-load mechanism.
-        for index, row in df.iterrows():
-            if index % 50 == 0:  # simple progress indicator
-                print(f"   Processed {index} records...")
-
-            # Validate and parse the submission UUID. Skip rows with invalid IDs.
-            try:
-                submission_id = uuid.UUID(row['id'])
-            except Exception:
-                # Skip malformed or missing UUIDs instead of failing the whole run
-                continue
-
-            # Parse the ISO timestamp. The CSV may include a trailing +00:00
-            # timezone; strip it before parsing to produce a naive datetime.
-            created_at = datetime.fromisoformat(row['created_at'].replace('+00:00', ''))
-
-            # Map CSV string labels to integer lookup IDs; allow None when the
-            # CSV value is missing/NaN.
-            age_range_id = age_ranges.get(row['age_range']) if pd.notna(row['age_range']) else None
-            region_id = regions.get(row['region']) if pd.notna(row['region']) else None
-
-            # Insert submission row. We catch IntegrityError to skip duplicate
-            # primary keys (submission_id). Other exceptions will be rolled back
-            # by the outer exception handler.
-            try:
-                cursor.execute("""
-                    INSERT INTO Submissions (submission_id, created_at, age_range_id, region_id, 
-                                           instability_ratio, first_name, last_name, email)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, submission_id, created_at, age_range_id, region_id,
-                   row['instability_ratio'] if pd.notna(row['instability_ratio']) else None,
-                   row['first_name'] if pd.notna(row['first_name']) else None,
-                   row['last_name'] if pd.notna(row['last_name']) else None,
-                   row['email'] if pd.notna(row['email']) else None)
-
-                submissions_loaded += 1
-            except pyodbc.IntegrityError:
-                # Duplicate submission ID or constraint violation; skip this row
-                continue
-
-            # CSV -> indicator name mapping. The CSV uses rate columns named for
-            # specific indicators; map those column names to the indicator label
-            # stored in the Indicators lookup table.
-            indicator_mapping = {
-                'economic_management_rate': 'Economic Management',
-                'immigration_policy_rate': 'Immigration Policy', 
-                'foreign_policy_rate': 'Foreign Policy',
-                'domestic_policy_rate': 'Domestic Policy', 
-                'social_policy_rate': 'Social Policy'
-            }
-
-            # Insert scores for each non-empty score column. We cast to int
-            # because CSV reading may produce floats by default (e.g. '3.0').
-            for csv_col, indicator_name in indicator_mapping.items():
-                if pd.notna(row[csv_col]):
-                    cursor.execute("""
-                        INSERT INTO SubmissionScores (submission_id, indicator_id, score_value)
-                        VALUES (?, ?, ?)
-                    """, submission_id, indicators[indicator_name], int(row[csv_col]))
-                    scores_loaded += 1
-
-            # If an email was provided, create a ReportRequests row with status
-            # 'completed' so downstream processes know a report has been generated.
-            if pd.notna(row['email']) and row['email'].strip():
-                cursor.execute("""
-                    INSERT INTO ReportRequests (submission_id, status)
-                    VALUES (?, 'completed')
-                """, submission_id)
-
-        # Commit the transaction when all rows are processed.
+        print("3. Processing CSV in chunks...")
+        for chunk_number, chunk in enumerate(_read_survey_chunks(), start=1):
+            loaded, scored = load_chunk(chunk)
+            conn.commit()
+            submissions_loaded += loaded
+            scores_loaded += scored
+            print(f"   Chunk {chunk_number}: read {len(chunk)} records, loaded {loaded} submissions")
+
+        # Report requests are created in one set-based statement once all
+        # submissions are in, instead of one INSERT per row with an email.
+        print("4. Creating report requests...")
+        reports_requested = _execute_counted(cursor, INSERT_REPORT_REQUESTS_SQL)
         conn.commit()
+
         print("5. Data loading completed!")
         print(f"   Submissions loaded: {submissions_loaded}")
         print(f"   Scores loaded: {scores_loaded}")
+        print(f"   Report requests created: {reports_requested}")
 
     except Exception as e:
         # Roll back any partial changes on unexpected errors.
         conn.rollback()
         print(f"ERROR: {e}")
     finally:
-        # Always ensure we close the connection.
-        conn.close()
+        # Always ensure we close the connection (dropping any temp table),
+        # unless it belongs to the caller, in which case its session
+        # settings are put back and only our cursor is released; the
+        # staging table is recreated on the next bulk load.
+        if owns_conn:
+            conn.close()
+        else:
+            if not caller_nocount:
+                cursor.execute("SET NOCOUNT OFF")
+            cursor.close()
+            conn.autocommit = caller_autocommit
+
+
+def _prepare_client_lookups(cursor):
+    """Set up the client-lookups path and return its per-chunk loader."""
+
+    print("2. Loading lookup tables...")
+
+    # Load lookup tables into Python dictionaries for fast mapping from the
+    # CSV's string labels to the integer surrogate keys used by the DB.
+    # They are loaded once and shared by every chunk.
+    cursor.execute("SELECT age_range_id, age_range_label FROM AgeRanges")
+    age_ranges = {row.age_range_label: row.age_range_id for row in cursor.fetchall()}
+    print(f"   Age ranges: {age_ranges}")
+
+    cursor.execute("SELECT region_id, region_name FROM Regions")
+    regions = {row.region_name: row.region_id for row in cursor.fetchall()}
+    print(f"   Regions: {regions}")
+
+    cursor.execute("SELECT indicator_id, indicator_name FROM Indicators")
+    indicators = {row.indicator_name: row.indicator_id for row in cursor.fetchall()}
+    print(f"   Indicators: {indicators}")
+
+    # Resolve each CSV rate column to its indicator_id once, rather than
+    # going through the indicator name for every score.
+    indicator_ids = {col: indicators[name] for col, name in INDICATOR_MAPPING.items()}
+
+    # Enable pyodbc's array parameter binding so each executemany() call
+    # sends the whole batch in a single round trip instead of one
+    # prepare/execute per row.
+    cursor.fast_executemany = True
+
+    # Existing submission IDs are fetched once and kept up to date as
+    # chunks are inserted, rather than queried again for every chunk.
+    existing_ids = _fetch_existing_submission_ids(cursor)
+    print(f"   {len(existing_ids)} submissions already in database")
+
+    # Values are validated and converted in bulk per chunk by
+    # _prepare_submissions() before the rows are sent.
+    return functools.partial(
+        _load_chunk, cursor, age_ranges=age_ranges, regions=regions,
+        indicator_ids=indicator_ids, existing_ids=existing_ids,
+    )
+
+
+def load_survey_data(conn=None):
+    """Read CSV rows and insert them into the database.
+
+    Behavior and contract:
+    - Input: CSV file at data/survey_responses_rows.csv; each row must have a
+      UUID in the `id` column and an ISO timestamp in `created_at`.
+    - Output: Inserts into Submissions, SubmissionScores and ReportRequests.
+    - Errors: Rows with invalid UUIDs or timestamps are skipped; duplicate
+      submission IDs (already in the database or repeated within the CSV)
+      are skipped. The CSV is processed in chunks of CSV_BLOCK_SIZE bytes,
+      each sent in batches with executemany() inside a manual-commit
+      transaction and committed on its own; any exception rolls back the
+      current chunk and stops the load.
+    - Connection: pass an open pyodbc connection as `conn` to reuse it across
+      several calls (e.g. in a pipeline). It runs in manual-commit mode with
+      NOCOUNT on during the load; both settings are restored afterwards and
+      the connection is left open. Otherwise a connection is opened and
+      closed by this call.
+    """
+
+    _run_load(conn, _prepare_client_lookups)
+
+
+def _bulk_load_chunk(cursor, df):
+    """Stage one CSV chunk and move it into the target tables server-side.
+
+    Returns a (submissions_loaded, scores_loaded) tuple. The caller owns the
+    transaction and commits after each chunk.
+    """
+
+    # Lookup labels are kept as-is; the server resolves them during the
+    # INSERT ... SELECT joins.
+    df = _to_db_values(_clean_submissions(df)[STAGING_COLUMNS])
+
+    cursor.execute(TRUNCATE_STAGING_SQL)
+    staging_rows = _param_rows(df, STAGING_COLUMNS)
+    if staging_rows:
+        cursor.executemany(INSERT_STAGING_SQL, staging_rows)
+
+    # Staged IDs already in Submissions (including ones committed from
+    # earlier chunks) are removed before the inserts.
+    cursor.execute(DELETE_STAGED_DUPLICATES_SQL)
+
+    submissions_loaded = _execute_counted(cursor, INSERT_SUBMISSIONS_FROM_STAGING_SQL)
+    scores_loaded = _execute_counted(cursor, INSERT_SCORES_FROM_STAGING_SQL)
+    return submissions_loaded, scores_loaded
+
+
+def _prepare_staging(cursor):
+    """Set up the staging-table path and return its per-chunk loader."""
+
+    print("2. Creating staging table...")
+
+    # The temp table lives for the lifetime of this connection, so it must
+    # be created and filled through the same cursor as the final inserts.
+    cursor.execute(CREATE_STAGING_SQL)
+    cursor.fast_executemany = True
+    return functools.partial(_bulk_load_chunk, cursor)
+
+
+def bulk_load_survey_data(conn=None):
+    """Load the CSV through a staging table and set-based INSERT ... SELECTs.
+
+    This is the script's default load path. Each cleaned chunk is sent in
+    one batch into a #StgSubmissions temp table; lookup IDs are then
+    resolved by joins and scores unpivoted on the server with one statement
+    per target table, so no lookup tables are read into Python. Input,
+    skipping rules and per-chunk commit/error handling are the same as
+    load_survey_data(). `conn` can likewise be a shared connection to reuse;
+    it gets its autocommit and NOCOUNT settings back when the load is done.
+    """
+
+    _run_load(conn, _prepare_staging)
 
 
 if __name__ == "__main__":
-    load_survey_data()
\ No newline at end of file
+    # Lookups are resolved server-side through the staging table unless
+    # --client-lookups asks for Python-side mapping and batched inserts.
+    if "--client-lookups" in sys.argv[1:]:
+        load_survey_data()
+    else:
+        bulk_load_survey_data()
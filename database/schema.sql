@@ -73,4 +73,8 @@ INSERT INTO Regions (region_name) VALUES
 -- 8. Create indexes for performance
 CREATE INDEX IX_Submissions_Email ON Submissions(email);
 CREATE INDEX IX_Submissions_CreatedAt ON Submissions(created_at);
-CREATE INDEX IX_SubmissionScores_Submission ON SubmissionScores(submission_id);
\ No newline at end of file
+CREATE INDEX IX_SubmissionScores_Submission ON SubmissionScores(submission_id);
+-- Filtered index for the report generator's "latest submission with an email"
+-- lookup: TOP 1 ... ORDER BY created_at DESC becomes a single index seek.
+CREATE INDEX IX_Submissions_CreatedAt_HasEmail ON Submissions(created_at DESC)
+    INCLUDE (email) WHERE email IS NOT NULL;
\ No newline at end of file
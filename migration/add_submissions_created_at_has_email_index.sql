@@ -0,0 +1,20 @@
+-- Migration: add the filtered index used by scripts/report_generator.py
+-- to find the latest submission that has an email.
+--
+-- created_at is the key (descending) so TOP 1 ... ORDER BY created_at DESC
+-- reads the first row of the index instead of scanning Submissions. The
+-- filter keeps only rows with an email, matching the query's WHERE clause.
+-- submission_id is the clustered primary key, so it is carried in the index
+-- without being listed.
+--
+-- Safe to re-run: the index is only created if it doesn't already exist.
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_Submissions_CreatedAt_HasEmail'
+      AND object_id = OBJECT_ID('Submissions')
+)
+BEGIN
+    CREATE INDEX IX_Submissions_CreatedAt_HasEmail ON Submissions(created_at DESC)
+        INCLUDE (email) WHERE email IS NOT NULL;
+END;
@@ -5,7 +5,8 @@ This module queries the local StabilityApp database for the most recent
 submission that contains an email address, then renders a small PDF
 containing user information and indicator scores. The intent is to
 produce a shareable 'stability evaluation' report for demonstration or
-emailing to a user.
+emailing to a user. Run with --all to generate a report for every
+submission that has an email in one batch.
 
 Assumptions:
 - The database schema contains Submissions, SubmissionScores, Indicators,
@@ -15,96 +16,128 @@ Assumptions:
 """
 
 import pandas as pd
+import os
 import pyodbc
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from datetime import datetime
 
-# Connection string used by pyodbc. Update SERVER/DATABASE to match your
-# environment if different. TrustServerCertificate is enabled for local
-# development convenience.
-connection_string = (
-    "DRIVER={ODBC Driver 18 for SQL Server};"
-    "SERVER=ALWYN-PC\\SQLEXPRESS;"
-    "DATABASE=StabilityApp;"
-    "Trusted_Connection=yes;"
-    "TrustServerCertificate=yes;"
-)
+# The connection settings live next to the data loader in database/; make
+# that directory importable when this script is run directly.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'database'))
+from db_connection import build_connection_string  # noqa: E402
 
+# Connection string used by pyodbc. Update SERVER to match your environment
+# if different; pooling and authentication are configured in
+# database/db_connection.py, shared with the data loader.
+connection_string = build_connection_string("ALWYN-PC\\SQLEXPRESS")
 
-def generate_sample_report():
-    """Generate a PDF report for the most recent submission that has an email.
 
-    The function performs three main steps:
-    1. Query the database for a submission ID that has an email.
-    2. Load submission details and associated indicator scores.
-    3. Render a simple PDF containing the user's details and scores.
-    """
+# Single batch returning two result sets for the sample report:
+# 1. Details of the latest submission that includes an email (so the report
+#    is for a contactable user), with lookup tables joined for readable
+#    labels. LEFT JOINs mean missing lookups don't fail the query — the
+#    report shows 'N/A' for missing values instead.
+# 2. All indicator scores for that submission.
+# NOCOUNT keeps row-count messages out of the result set sequence. It is a
+# session setting, so its previous value (bit 512 of @@OPTIONS) is saved and
+# put back at the end, leaving a caller's shared connection as it was.
+SAMPLE_REPORT_SQL = """
+    DECLARE @nocount BIT = @@OPTIONS & 512;
+    SET NOCOUNT ON;
 
-    print("Generating sample PDF report...")
+    DECLARE @sid UNIQUEIDENTIFIER = (
+        SELECT TOP 1 submission_id FROM Submissions
+        WHERE email IS NOT NULL
+        ORDER BY created_at DESC
+    );
 
-    # Open a DB connection and cursor. We close the connection after reading
-    # the required rows to avoid holding DB resources while creating the PDF.
-    conn = pyodbc.connect(connection_string)
-    cursor = conn.cursor()
+    SELECT s.submission_id, s.created_at, s.instability_ratio,
+           s.first_name, s.last_name, s.email,
+           ar.age_range_label, r.region_name
+    FROM Submissions s
+    LEFT JOIN AgeRanges ar ON s.age_range_id = ar.age_range_id
+    LEFT JOIN Regions r ON s.region_id = r.region_id
+    WHERE s.submission_id = @sid;
 
-    # Find the latest submission that includes an email so we can generate a
-    # report for a contactable user. TOP 1 ensures we only fetch one row.
-    cursor.execute("""
-        SELECT TOP 1 submission_id FROM Submissions 
-        WHERE email IS NOT NULL 
-        ORDER BY created_at DESC
-    """)
+    SELECT i.indicator_name, ss.score_value
+    FROM SubmissionScores ss
+    JOIN Indicators i ON ss.indicator_id = i.indicator_id
+    WHERE ss.submission_id = @sid;
 
-    result = cursor.fetchone()
-    if not result:
-        # No available submission with an email — nothing to generate.
-        print("No submissions with email found!")
-        return
+    IF @nocount = 0 SET NOCOUNT OFF;
+"""
 
-    submission_id = result[0]
-
-    # Retrieve submission details and join lookup tables for readable labels
-    # (age range and region). We use LEFT JOIN so missing lookups don't fail
-    # the query — the code will display 'N/A' for missing values later.
-    cursor.execute("""
-        SELECT s.submission_id, s.created_at, s.instability_ratio,
-               s.first_name, s.last_name, s.email,
-               ar.age_range_label, r.region_name
-        FROM Submissions s
-        LEFT JOIN AgeRanges ar ON s.age_range_id = ar.age_range_id
-        LEFT JOIN Regions r ON s.region_id = r.region_id
-        WHERE s.submission_id = ?
-    """, submission_id)
+# Batch report queries used by generate_reports(): every submission with an
+# email (same columns as the sample report), then all of their scores.
+REPORT_SUBMISSIONS_SQL = """
+    SELECT s.submission_id, s.created_at, s.instability_ratio,
+           s.first_name, s.last_name, s.email,
+           ar.age_range_label, r.region_name
+    FROM Submissions s
+    LEFT JOIN AgeRanges ar ON s.age_range_id = ar.age_range_id
+    LEFT JOIN Regions r ON s.region_id = r.region_id
+    WHERE s.email IS NOT NULL
+"""
 
-    submission = cursor.fetchone()
+REPORT_SCORES_SQL = """
+    SELECT ss.submission_id, i.indicator_name, ss.score_value
+    FROM SubmissionScores ss
+    JOIN Indicators i ON ss.indicator_id = i.indicator_id
+    JOIN Submissions s ON ss.submission_id = s.submission_id
+    WHERE s.email IS NOT NULL
+    ORDER BY ss.submission_id, i.display_order
+"""
 
-    # Fetch all indicator scores for this submission and convert to a dict
-    # mapping indicator name -> numeric score for convenient rendering.
-    cursor.execute("""
-        SELECT i.indicator_name, ss.score_value
-        FROM SubmissionScores ss
-        JOIN Indicators i ON ss.indicator_id = i.indicator_id
-        WHERE ss.submission_id = ?
-    """, submission_id)
 
-    scores = {row.indicator_name: row.score_value for row in cursor.fetchall()}
+# Paragraph styles and table styles are built once at import time and reused
+# by every report, rather than re-created on each call.
+STYLES = getSampleStyleSheet()
+
+# User info table: simple styling with a light header row.
+USER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
 
-    # We can close the DB connection now — PDF generation is purely local.
-    conn.close()
+# Scores table: a darker header and a subtle body background color to improve
+# readability.
+SCORE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+
+def render_report(submission, scores):
+    """Render the stability report PDF for one submission.
+
+    `submission` is any row object exposing the submission columns as
+    attributes (a pyodbc Row or a namedtuple from DataFrame.itertuples) and
+    `scores` maps indicator name -> score. Returns the written filename.
+    Only module-level styles are shared, so this can run in worker threads.
+    """
 
     # Build filename using the submission ID so it's easy to correlate files
     # with database records. Keep PDF generation simple using ReportLab's
     # high-level Platypus API (Paragraph, Table, Spacer, etc.).
-    filename = f"stability_report_{submission_id}.pdf"
+    filename = f"stability_report_{submission.submission_id}.pdf"
     doc = SimpleDocTemplate(filename, pagesize=letter)
     story = []  # the document flowable list
-    styles = getSampleStyleSheet()
 
     # Title
-    title = Paragraph("STABILITY EVALUATION REPORT", styles['Heading1'])
+    title = Paragraph("STABILITY EVALUATION REPORT", STYLES['Heading1'])
     story.append(title)
     story.append(Spacer(1, 20))
 
@@ -118,23 +151,16 @@ def generate_sample_report():
         ["Age Range:", submission.age_range_label or 'N/A']
     ]
 
-    # Table layout for user info with simple styling. Column widths chosen to
-    # give the label a narrow column and the value a wider column.
+    # Table layout for user info. Column widths chosen to give the label a
+    # narrow column and the value a wider column.
     user_table = Table(user_data, colWidths=[100, 400])
-    user_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    user_table.setStyle(USER_TABLE_STYLE)
 
     story.append(user_table)
     story.append(Spacer(1, 20))
 
     # Scores section header
-    story.append(Paragraph("Indicator Scores", styles['Heading2']))
+    story.append(Paragraph("Indicator Scores", STYLES['Heading2']))
 
     # Prepare data for the scores table; include a header row first.
     score_data = [['Indicator', 'Score']]
@@ -147,17 +173,9 @@ def generate_sample_report():
     # formatting to show two decimal places.
     score_data.append(['Instability Ratio', f"{submission.instability_ratio:.2f}"])
 
-    # Create the table for scores with a darker header and a subtle body
-    # background color to improve readability.
+    # Create the table for scores (styled by SCORE_TABLE_STYLE).
     score_table = Table(score_data, colWidths=[350, 150])
-    score_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    score_table.setStyle(SCORE_TABLE_STYLE)
 
     story.append(score_table)
 
@@ -165,7 +183,127 @@ def generate_sample_report():
     # operation that writes `filename` to disk in the current working directory.
     doc.build(story)
     print(f"PDF report generated: {filename}")
+    return filename
+
+
+def generate_sample_report(conn=None):
+    """Generate a PDF report for the most recent submission that has an email.
+
+    The function performs two main steps:
+    1. Load the latest submission that has an email, together with its
+       indicator scores, in one batched query.
+    2. Render a simple PDF containing the user's details and scores with
+       render_report().
+
+    Pass an open pyodbc connection as `conn` to reuse it (it is left open);
+    otherwise a connection is opened and closed by this call.
+    """
+
+    print("Generating sample PDF report...")
+
+    # Open a DB connection (unless one was supplied) and cursor. We close our
+    # connection after reading the required rows to avoid holding DB
+    # resources while creating the PDF.
+    owns_conn = conn is None
+    if owns_conn:
+        conn = pyodbc.connect(connection_string)
+    cursor = conn.cursor()
+
+    # Fetch the submission details and its scores in a single round trip; the
+    # batch returns two result sets which we read in order with nextset().
+    cursor.execute(SAMPLE_REPORT_SQL)
+
+    submission = cursor.fetchone()
+    if not submission:
+        # No available submission with an email — nothing to generate.
+        print("No submissions with email found!")
+        cursor.close()
+        if owns_conn:
+            conn.close()
+        return
+
+    # Second result set: indicator scores, converted to a dict mapping
+    # indicator name -> numeric score for convenient rendering.
+    cursor.nextset()
+    scores = {row.indicator_name: row.score_value for row in cursor.fetchall()}
+
+    # We can release the DB resources now — PDF generation is purely local.
+    cursor.close()
+    if owns_conn:
+        conn.close()
+
+    render_report(submission, scores)
+
+
+def _fetch_frame(cursor, sql):
+    """Run `sql` and return its rows as a DataFrame named after the columns.
+
+    Built from cursor.description so a raw pyodbc connection can be used
+    without going through pd.read_sql, which only supports SQLAlchemy
+    connectables and sqlite3 without warning.
+    """
+
+    rows = cursor.execute(sql).fetchall()
+    columns = [column[0] for column in cursor.description]
+    return pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns)
+
+
+def generate_reports(conn=None, max_workers=None):
+    """Generate a PDF report for every submission that has an email.
+
+    All target submissions and all of their scores are fetched with two
+    queries, rather than repeating the single-report queries per user. The
+    scores are grouped by submission in pandas and the PDFs are rendered by
+    a thread pool (`max_workers` defaults to the CPU count) so file output
+    overlaps across reports. Returns the list of generated filenames.
+
+    Pass an open pyodbc connection as `conn` to reuse it (it is left open);
+    otherwise a connection is opened and closed by this call.
+    """
+
+    print("Generating PDF reports for all submissions with email...")
+
+    owns_conn = conn is None
+    if owns_conn:
+        conn = pyodbc.connect(connection_string)
+    cursor = conn.cursor()
+    try:
+        subs_df = _fetch_frame(cursor, REPORT_SUBMISSIONS_SQL)
+        scores_df = _fetch_frame(cursor, REPORT_SCORES_SQL)
+    finally:
+        # PDF generation is purely local, so release the DB resources first.
+        cursor.close()
+        if owns_conn:
+            conn.close()
+
+    if subs_df.empty:
+        print("No submissions with email found!")
+        return []
+
+    # Missing values become None so render_report() can fall back to 'N/A'
+    # exactly as it does for pyodbc rows.
+    subs_df = subs_df.astype(object).where(subs_df.notna(), None)
+
+    # indicator name -> score per submission, keeping the query's ordering.
+    scores_by_id = {
+        submission_id: dict(zip(group['indicator_name'], group['score_value']))
+        for submission_id, group in scores_df.groupby('submission_id', sort=False)
+    }
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        filenames = list(executor.map(
+            lambda submission: render_report(submission, scores_by_id.get(submission.submission_id, {})),
+            subs_df.itertuples(index=False),
+        ))
+
+    print(f"{len(filenames)} PDF reports generated")
+    return filenames
 
 
 if __name__ == "__main__":
-    generate_sample_report()
\ No newline at end of file
+    # Pass --all to generate a report for every submission with an email
+    # instead of just the most recent one.
+    if "--all" in sys.argv[1:]:
+        generate_reports()
+    else:
+        generate_sample_report()